@@ -30,6 +30,24 @@ class EntityPrefix(str, Enum):
     OUTPUT_RATE = "output_rate"
     PHYSICAL_INPUT_SELECTED = "physical_input_selected"
 
+
+_DISPLAY_NAME_OVERRIDES = {
+    "ASPECT_4_X_3": "4x3",
+    "ASPECT_16_X_9": "16x9",
+}
+
+
+def _display_name_for(name: str) -> str:
+    """Return the display name for a `SimpleCommands` member name."""
+    if name in _DISPLAY_NAME_OVERRIDES:
+        return _DISPLAY_NAME_OVERRIDES[name]
+    if name.startswith("NUM_"):
+        return name[4:]
+    if name.startswith("ASPECT_"):
+        return name[7:].replace("_", ".")
+    return name
+
+
 class SimpleCommands(str, Enum):
     """Enumeration of supported remote command names for Lumagen control."""
 
@@ -86,24 +104,22 @@ class SimpleCommands(str, Enum):
     UP = "up"
     ZONE = "zone"
 
+    def __init__(self, *_args):
+        self._display_name = _display_name_for(self.name)
+
     @property
     def display_name(self) -> str:
         """
         Returns the display-friendly command name for use in UI or command APIs.
         Normalizes enum member names like NUM_0 ? "0", ASPECT_1_85 ? "1.85", etc.
+        The name is computed once when the member is created.
 
         :return: A display-safe string.
         """
-        name = self.name
-        if name.startswith("NUM_"):
-            return name[4:]
-        if name == "ASPECT_4_X_3":
-            return "4x3"
-        if name == "ASPECT_16_X_9":
-            return "16x9"
-        if name.startswith("ASPECT_"):
-            return name[7:].replace("_", ".")
-        return name
+        return self._display_name
+
+
+SIMPLE_COMMAND_NAMES = tuple(cmd.display_name for cmd in SimpleCommands.__members__.values())
 
 
 class MediaPlayerDef: # pylint: disable=too-few-public-methods
@@ -133,4 +149,4 @@ class RemoteDef: # pylint: disable=too-few-public-methods
     attributes = {
         remote.Attributes.STATE: remote.States.UNKNOWN
     }
-    simple_commands = [cmd.display_name for cmd in SimpleCommands]
+    simple_commands = SIMPLE_COMMAND_NAMES
@@ -6,10 +6,11 @@ import logging
 from asyncio import AbstractEventLoop
 from dataclasses import dataclass
 from enum import Enum, IntEnum
-from typing import Any
+from functools import partial
+from typing import Any, Callable
 
 import ucapi
-from const import EntityPrefix
+from const import EntityPrefix, SimpleCommands
 from pyee.asyncio import AsyncIOEventEmitter
 from pylumagen.lumagen import DeviceInfo, DeviceManager
 from pylumagen.models.constants import ConnectionStatus, EventType
@@ -24,6 +25,45 @@ ParamDict = dict[str, ParamType]
 
 _LOG = logging.getLogger(__name__)
 
+# Plain string entity prefixes used on the update path
+_MEDIA_PLAYER = EntityPrefix.MEDIA_PLAYER.value
+_REMOTE = EntityPrefix.REMOTE.value
+_CURRENT_SOURCE_CONTENT_ASPECT = EntityPrefix.CURRENT_SOURCE_CONTENT_ASPECT.value
+_DETECTED_SOURCE_ASPECT = EntityPrefix.DETECTED_SOURCE_ASPECT.value
+_INPUT_FORMAT = EntityPrefix.INPUT_FORMAT.value
+_INPUT_MODE = EntityPrefix.INPUT_MODE.value
+_INPUT_RATE = EntityPrefix.INPUT_RATE.value
+_PHYSICAL_INPUT_SELECTED = EntityPrefix.PHYSICAL_INPUT_SELECTED.value
+_POWER_STATE_PREFIXES = (_MEDIA_PLAYER, _REMOTE)
+
+# Interval in seconds at which the label fetch polls for the device's first alive answer
+_ALIVE_POLL_INTERVAL = 0.5
+
+# Window in seconds in which attribute updates for an entity are merged into one UPDATE event
+_UPDATE_COALESCE_DELAY = 0.02
+
+# Executor method names by simple command, numeric keys map to send_<n>
+EXECUTOR_METHODS: dict[SimpleCommands, str] = {
+    cmd: f"send_{cmd.value}" if cmd.value.isdigit() else cmd.value for cmd in SimpleCommands
+}
+
+# Device attributes forwarded as-is to a sensor entity
+_SENSOR_ATTRIBUTES = {
+    "current_source_content_aspect": _CURRENT_SOURCE_CONTENT_ASPECT,
+    "detected_source_aspect": _DETECTED_SOURCE_ASPECT,
+    "source_mode": _INPUT_MODE,
+    "source_vertical_rate": _INPUT_RATE,
+    "source_dynamic_range": _INPUT_FORMAT,
+}
+
+
+def _index_sources(source_list: list[str]) -> dict[str, int]:
+    """Map each source name to the position of its first occurrence, like list.index()."""
+    index: dict[str, int] = {}
+    for position, name in enumerate(source_list):
+        index.setdefault(name, position)
+    return index
+
 class Events(IntEnum):
     """Internal driver events."""
 
@@ -34,13 +74,23 @@ class Events(IntEnum):
     UPDATE = 4
     IP_ADDRESS_CHANGED = 5
 
+# Emitter event names, resolved once instead of through the enum on every emit
+EVENT_CONNECTED = Events.CONNECTED.name
+EVENT_DISCONNECTED = Events.DISCONNECTED.name
+
 class PowerStateEnum(str, Enum):
     """Power States."""
     UNKNOWN = "unknown"
     ACTIVE = "Active"
     STANDBY = "Standby"
 
-@dataclass
+_POWER_STATE_BY_VALUE = {member.value: member for member in PowerStateEnum}
+_MEDIA_STATE_BY_POWER_STATE = {
+    PowerStateEnum.ACTIVE: States.ON,
+    PowerStateEnum.STANDBY: States.STANDBY,
+}
+
+@dataclass(slots=True)
 class LumagenInfo:
     """Dataclass for device identity and metadata."""
     id: str
@@ -61,6 +111,33 @@ class LumagenInfo:
 class LumagenDevice:
     """Handles communication with a Lumagen video processor over TCP."""
 
+    __slots__ = (
+        "device_id",
+        "host",
+        "port",
+        "discovery",
+        "_entity_ids",
+        "_event_loop",
+        "_reconnect_task",
+        "_connected",
+        "_disconnecting",
+        "_is_alive",
+        "_labels_task",
+        "_attr_state",
+        "_attributes_cache",
+        "current_status",
+        "device",
+        "_source_list",
+        "_source_index",
+        "_active_source",
+        "dispatcher",
+        "events",
+        "_update_listeners",
+        "_method_cache",
+        "_pending_updates",
+        "_update_handle",
+    )
+
     def __init__(
         self,
         host: str,
@@ -74,6 +151,7 @@ class LumagenDevice:
         self.host = host
         self.port = port
         self.discovery = discovery
+        self._entity_ids = {prefix.value: f"{prefix.value}.{self.device_id}" for prefix in EntityPrefix}
 
         # Event loop and internal connection state
         self._event_loop = loop or asyncio.get_running_loop()
@@ -81,28 +159,24 @@ class LumagenDevice:
         self._connected: bool = False
         self._disconnecting: bool = False
         self._is_alive: bool = False
+        self._labels_task: asyncio.Task | None = None
         self._attr_state = States.OFF
+        self._attributes_cache: dict[str, Any] | None = None
         self.current_status: PowerStateEnum = PowerStateEnum.UNKNOWN
 
         # Device management and communication
         self.device = DeviceManager(connection_type="ip", reconnect=False)
         self._source_list = self.device.source_list
+        self._source_index = _index_sources(self._source_list)
         self._active_source = None
         self.dispatcher = self.device.dispatcher
         self.events = AsyncIOEventEmitter(self._event_loop)
+        self._update_listeners: list[Callable[["LumagenDevice", str, dict[str, Any]], None]] = []
+        self._method_cache: dict[str, tuple[Callable, int, bool]] = {}
+        self._pending_updates: dict[str, dict[str, Any]] = {}
+        self._update_handle: asyncio.TimerHandle | None = None
 
         # Internal event subscriptions
-        self._attr_handlers = {
-            "device_status": self._handle_device_status,
-            "is_alive": self._handle_is_alive,
-            "input_labels": self._handle_input_labels,
-            "physical_input_selected": self._handle_physical_input_selected,
-            "current_source_content_aspect": self._handle_current_source_content_aspect,
-            "detected_source_aspect": self._handle_detected_source_aspect,
-            "source_mode": self._handle_source_mode,
-            "source_vertical_rate": self._handle_source_vertical_rate,
-            "source_dynamic_range": self._handle_source_dynamic_range,
-        }
         self._subscribe_device_state_events()
 
     def __repr__(self):
@@ -110,68 +184,84 @@ class LumagenDevice:
 
     def _subscribe_device_state_events(self):
         """Subscribe to device state updates from the dispatcher."""
-        for attr_name in self._attr_handlers:
-            self.dispatcher.register_listener(attr_name, self._create_event_callback(attr_name))
+        handlers = [
+            ("device_status", self._handle_device_status),
+            ("is_alive", self._handle_is_alive),
+            ("input_labels", self._handle_input_labels),
+            ("physical_input_selected", self._handle_physical_input_selected),
+        ]
+        handlers.extend(
+            (attr_name, partial(self._handle_sensor_value, attr_name, prefix))
+            for attr_name, prefix in _SENSOR_ATTRIBUTES.items()
+        )
+        for attr_name, handler in handlers:
+            self.dispatcher.register_listener(attr_name, partial(self._dispatch_state_event, handler))
 
         self.dispatcher.register_listener(
             EventType.CONNECTION_STATE, self._handle_connection_state
         )
 
-    def _create_event_callback(self, attr_name: str):
-        """Create an async callback for attribute change events."""
-        async def callback(event_data: dict):
-            await self._on_device_state_event(attr_name, event_data)
-        return lambda _, ed: asyncio.create_task(callback(ed))
-
-    async def _on_device_state_event(self, attr_name: str, event_data: dict) -> None:
-        """Dispatch state event to the appropriate handler."""
-        value = event_data.get("value")
-        _LOG.debug("State changed: %s -> %s", attr_name, value)
-
-        handler = self._attr_handlers.get(attr_name)
-        if handler:
-            await handler(value)
-        else:
-            _LOG.debug("No handler registered for attribute: %s", attr_name)
+    def _dispatch_state_event(self, handler: Callable, _, event_data: dict) -> None:
+        """Run an attribute handler with the value of a dispatcher state event."""
+        try:
+            handler(event_data.get("value"))
+        except Exception:
+            _LOG.exception("Error handling device state event")
 
-    async def _handle_device_status(self, value: Any) -> None:
+    def _handle_device_status(self, value: Any) -> None:
         """Handle updates to device power status."""
-        try:
-            self.current_status = PowerStateEnum(value)
-            if self.current_status == PowerStateEnum.ACTIVE:
-                self._attr_state = States.ON
-            elif self.current_status == PowerStateEnum.STANDBY:
-                self._attr_state = States.STANDBY
-            else:
-                self._attr_state = States.UNKNOWN
-            await self._emit_update(EntityPrefix.MEDIA_PLAYER.value, MediaAttr.STATE, self._attr_state)
-            await self._emit_update(EntityPrefix.REMOTE.value, MediaAttr.STATE, self._attr_state)
-        except ValueError:
+        status = _POWER_STATE_BY_VALUE.get(value)
+        if status is None:
             _LOG.warning("Unknown power state received: %s", value)
             self.current_status = PowerStateEnum.UNKNOWN
             self._attr_state = States.UNKNOWN
+            self._attributes_cache = None
+            return
 
-    async def _handle_is_alive(self, _: Any) -> None:
+        self.current_status = status
+        self._attr_state = _MEDIA_STATE_BY_POWER_STATE.get(status, States.UNKNOWN)
+        self._attributes_cache = None
+        self._emit_update_many(_POWER_STATE_PREFIXES, MediaAttr.STATE, self._attr_state)
+
+    def _handle_is_alive(self, _: Any) -> None:
         """Mark device as alive."""
         self._is_alive = True
 
-    async def _handle_input_labels(self, value: Any) -> None:
+    async def _fetch_labels(self) -> None:
+        """Request the input labels once the device answers the alive check after connecting."""
+        # The is_alive event only fires on a change, so poll the state pylumagen keeps
+        while not self.device.is_alive:
+            if not self._connected:
+                return
+            await asyncio.sleep(_ALIVE_POLL_INTERVAL)
+
+        _LOG.debug("Fetching labels after connection...")
+        try:
+            await self.device.executor.get_labels(get_all=False)
+        except (ConnectionError, asyncio.exceptions.TimeoutError) as e:
+            _LOG.warning("Failed to fetch labels from Lumagen at %s:%d - %s", self.host, self.port, e)
+
+    def _handle_input_labels(self, value: Any) -> None:
         """Handle input label updates from the device."""
-        await self._emit_update(EntityPrefix.MEDIA_PLAYER.value, MediaAttr.SOURCE_LIST, value)
+        self._emit_update(_MEDIA_PLAYER, MediaAttr.SOURCE_LIST, value)
         self._source_list = self.device.source_list
-        _LOG.debug(self.source_list)
+        self._attributes_cache = None
+        self._source_index = _index_sources(self._source_list)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("Source list: %s", self._source_list)
 
-    async def _handle_physical_input_selected(self, value: Any) -> None:
+    def _handle_physical_input_selected(self, value: Any) -> None:
         """Handle selection of a physical input."""
         try:
             index = int(value) - 1
             source_name = self._source_list[index] if 0 <= index < len(self._source_list) else None
             if source_name:
                 self._active_source = source_name
-                await self._emit_update(EntityPrefix.MEDIA_PLAYER.value, MediaAttr.SOURCE, source_name)
+                self._attributes_cache = None
+                self._emit_update(_MEDIA_PLAYER, MediaAttr.SOURCE, source_name)
             else:
                 _LOG.warning("Invalid physical_input_selected index: %s", value)
-            await self._emit_update(EntityPrefix.PHYSICAL_INPUT_SELECTED.value, SensorAttr.VALUE, f"Input: {value}")
+            self._emit_update(_PHYSICAL_INPUT_SELECTED, SensorAttr.VALUE, f"Input: {value}")
         except (ValueError, TypeError):
             _LOG.warning("Unable to process physical_input_selected value: %s", value)
 
@@ -179,57 +269,71 @@ class LumagenDevice:
         """Process connection state changes."""
         state = event_data.get("state")
 
-        if state == ConnectionStatus.DISCONNECTED:
+        if state is ConnectionStatus.DISCONNECTED:
             _LOG.debug("Connection state: DISCONNECTED")
             self._connected = False
             self._is_alive = False
+            self._cancel_labels_task()
             self._attr_state = States.UNAVAILABLE
-            self.events.emit(Events.DISCONNECTED.name, self.device_id)
+            self._attributes_cache = None
+            self.events.emit(EVENT_DISCONNECTED, self.device_id)
 
             # Prevent reconnect if we explicitly called disconnect
             if not self._disconnecting:
                 if self._reconnect_task is None or self._reconnect_task.done():
-                    self._reconnect_task = asyncio.create_task(self._reconnect_loop())
+                    self._reconnect_task = self._event_loop.create_task(self._reconnect_loop())
 
-        elif state == ConnectionStatus.CONNECTED:
+        elif state is ConnectionStatus.CONNECTED:
             label = "IP2SL device" if self.discovery else "Lumagen"
             _LOG.info("Connected to %s at %s:%d", label, self.host, self.port)
             self._connected = True
-            self.events.emit(Events.CONNECTED.name, self.device_id)
-
-            await asyncio.sleep(1)
-            _LOG.debug("Fetching labels after connection...")
-            await self.device.executor.get_labels(get_all=False)
-
-    async def _handle_current_source_content_aspect(self, value: Any) -> None:
-        _LOG.debug("Handle current_source_content_aspect.....................")
-        _LOG.debug("Event received: %s", value)
-        await self._emit_update(EntityPrefix.CURRENT_SOURCE_CONTENT_ASPECT.value, SensorAttr.VALUE, str(value))
-
-    async def _handle_detected_source_aspect(self, value: Any) -> None:
-        _LOG.debug("Handle detected_source_aspect.....................")
-        _LOG.debug("Event received: %s", value)
-        await self._emit_update(EntityPrefix.DETECTED_SOURCE_ASPECT.value, SensorAttr.VALUE, str(value))
-
-    async def _handle_source_mode(self, value: Any) -> None:
-        _LOG.debug("Handle source_mode.....................")
-        _LOG.debug("Event received: %s", value)
-        await self._emit_update(EntityPrefix.INPUT_MODE.value, SensorAttr.VALUE, str(value))
-
-    async def _handle_source_vertical_rate(self, value: Any) -> None:
-        _LOG.debug("Handle source_vertical_rate.....................")
-        _LOG.debug("Event received: %s", value)
-        await self._emit_update(EntityPrefix.INPUT_RATE.value, SensorAttr.VALUE, str(value))
-
-    async def _handle_source_dynamic_range(self, value: Any) -> None:
-        _LOG.debug("Handle source_dynamic_range.....................")
-        _LOG.debug("Event received: %s", value)
-        await self._emit_update(EntityPrefix.INPUT_FORMAT.value, SensorAttr.VALUE, str(value))
+            self._cancel_labels_task()
+            self._labels_task = self._event_loop.create_task(self._fetch_labels())
+            self.events.emit(EVENT_CONNECTED, self.device_id)
+
+    def _cancel_labels_task(self) -> None:
+        """Cancel a label fetch that is still waiting or running."""
+        if self._labels_task is not None and not self._labels_task.done():
+            self._labels_task.cancel()
+        self._labels_task = None
+
+    def _handle_sensor_value(self, attr_name: str, prefix: str, value: Any) -> None:
+        """Forward a device attribute unchanged as the value of its sensor entity."""
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("Handle %s: %s", attr_name, value)
+        self._emit_update(prefix, SensorAttr.VALUE, str(value))
+
+    def _emit_update(self, prefix: str, attr: str, value: Any) -> None:
+        """Queue an attribute update for an entity, to be emitted with others in the same window."""
+        self._pending_updates.setdefault(self._entity_ids[prefix], {})[attr] = value
+        if self._update_handle is None:
+            self._update_handle = self._event_loop.call_later(
+                _UPDATE_COALESCE_DELAY, self._flush_updates
+            )
+
+    def _emit_update_many(self, prefixes: tuple[str, ...], attr: str, value: Any) -> None:
+        """Queue the same attribute update for several entities."""
+        for prefix in prefixes:
+            self._emit_update(prefix, attr, value)
+
+    def _flush_updates(self) -> None:
+        """Emit one UPDATE event per entity with all attributes queued since the last flush."""
+        pending, self._pending_updates = self._pending_updates, {}
+        self._update_handle = None
+        for entity_id, update in pending.items():
+            try:
+                for callback in self._update_listeners:
+                    callback(self, entity_id, update)
+            except Exception:
+                _LOG.exception("Error dispatching update for %s", entity_id)
 
-    async def _emit_update(self, prefix: str, attr: str, value: Any) -> None:
-        entity_id = f"{prefix}.{self.device_id}"
-        self.events.emit(Events.UPDATE.name, entity_id, {attr: value})
+    def on_update(self, callback: Callable[["LumagenDevice", str, dict[str, Any]], None]) -> None:
+        """Register a callback invoked directly with (device, entity_id, update) for each entity update."""
+        self._update_listeners.append(callback)
 
+    def remove_update_listeners(self) -> None:
+        """Remove all registered update callbacks."""
+        self._update_listeners.clear()
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -239,7 +343,7 @@ class LumagenDevice:
     @property
     def is_on(self) -> bool:
         """Return whether device is powered on."""
-        return self.current_status == PowerStateEnum.ACTIVE
+        return self.current_status is PowerStateEnum.ACTIVE
 
     @property
     def is_alive(self) -> bool:
@@ -256,6 +360,11 @@ class LumagenDevice:
         """Return currently active source."""
         return self._active_source
 
+    @property
+    def source_index(self) -> int | None:
+        """Return the zero-based position of the active source in the source list, or None."""
+        return self._source_index.get(self._active_source)
+
     @property
     def state(self) -> States:
         """Return current device state."""
@@ -263,15 +372,22 @@ class LumagenDevice:
 
     @property
     def attributes(self) -> dict[str, any]:
-        """Return device attributes dictionary."""
-        updated_data = {
-            MediaAttr.STATE: self.state,
-        }
-        if self.source_list:
-            updated_data[MediaAttr.SOURCE_LIST] = self.source_list
-        if self.source:
-            updated_data[MediaAttr.SOURCE] = self.source
-        return updated_data
+        """
+        Return device attributes dictionary.
+
+        The dictionary is cached until the state, source list or source changes
+        and is shared between callers, so it must not be modified.
+        """
+        if self._attributes_cache is None:
+            updated_data = {
+                MediaAttr.STATE: self._attr_state,
+            }
+            if self._source_list:
+                updated_data[MediaAttr.SOURCE_LIST] = self._source_list
+            if self._active_source:
+                updated_data[MediaAttr.SOURCE] = self._active_source
+            self._attributes_cache = updated_data
+        return self._attributes_cache
 
     async def connect(self) -> bool:
         """Establish a connection to the Lumagen device with retry logic."""
@@ -289,12 +405,15 @@ class LumagenDevice:
             _LOG.error("Failed to connect to Lumagen at %s:%d - %s", self.host, self.port, e)
             return False
 
+        # The executor is recreated on every open, bind the command methods to the new one
+        self._method_cache = self._build_method_cache()
         return True
 
     async def _reconnect_loop(self, delay: float = 10.0):
         """Try to reconnect to the device in a loop."""
         _LOG.info("Starting reconnect loop to Lumagen at %s:%d", self.host, self.port)
         self._attr_state = States.UNAVAILABLE
+        self._attributes_cache = None
 
         while not self._connected:
             try:
@@ -315,6 +434,7 @@ class LumagenDevice:
             self._disconnecting = True  # prevent reconnect loop
             label = "IP2SL device" if self.discovery else "Lumagen"
             _LOG.debug("Disconnecting from %s at %s:%d", label, self.host, self.port)
+            self._cancel_labels_task()
             await self.device.close()
             self._connected = False
             self._disconnecting = False  # reset for future reconnects
@@ -332,15 +452,15 @@ class LumagenDevice:
         parms: ParamType | ParamTuple | ParamDict | None = None
     ) -> ucapi.StatusCodes:
         """Dynamically invoke a command method from executor."""
-        method = getattr(self.device.executor, command, None)
-        if not callable(method):
+        resolved = self._method_cache.get(command)
+        if resolved is None:
             _LOG.warning("No executor method found for command: %s", command)
             return ucapi.StatusCodes.NOT_IMPLEMENTED
 
+        method, param_count, is_coro = resolved
         try:
-            sig = inspect.signature(method)
             # Handle methods with no parameters
-            if len(sig.parameters) == 0:
+            if param_count == 0:
                 result = method()
             # Unpack parameters based on type
             elif isinstance(parms, (list, tuple)):
@@ -350,8 +470,8 @@ class LumagenDevice:
             else:
                 result = method(parms)
 
-            # Await result if it's a coroutine
-            if asyncio.iscoroutine(result):
+            # Await result if the method is a coroutine function
+            if is_coro:
                 await result
 
             return ucapi.StatusCodes.OK
@@ -359,6 +479,29 @@ class LumagenDevice:
             _LOG.exception("Error executing command %s: %s", command, str(err))
             return ucapi.StatusCodes.BAD_REQUEST
 
+    def _build_method_cache(self) -> dict[str, tuple[Callable, int, bool]]:
+        """
+        Resolve every known command on the current executor once, recording the
+        method, its parameter count and whether it is a coroutine function.
+        """
+        executor = self.device.executor
+        cache = {}
+        missing = []
+        for command in EXECUTOR_METHODS.values():
+            method = getattr(executor, command, None)
+            if not callable(method):
+                missing.append(command)
+                continue
+            cache[command] = (
+                method,
+                len(inspect.signature(method).parameters),
+                asyncio.iscoroutinefunction(method),
+            )
+
+        if missing:
+            _LOG.info("Executor missing methods for SimpleCommands: %s", ", ".join(missing))
+        return cache
+
     async def power_on(self) -> ucapi.StatusCodes:
         """Turn the device on."""
         if self.is_on:
@@ -381,11 +524,12 @@ class LumagenDevice:
 
     async def select_source(self, source: str) -> StatusCodes:
         """Set input source on the device."""
-        if not source or source not in self.source_list:
+        index = self._source_index.get(source) if source else None
+        if index is None:
             _LOG.warning("Invalid source: %s", source)
             return StatusCodes.BAD_REQUEST
         try:
-            index = self.source_list.index(source) + 1
+            index += 1
             await self.device.executor.input(index)
             _LOG.info("Sent source select command for input %02d", index)
             return StatusCodes.OK
@@ -18,6 +18,21 @@ ITACH_PORT = 4999
 ITACH_MULTICAST_IP = "239.255.250.250"
 MULTICAST_INTERFACE_IP = "0.0.0.0"
 
+class _ITachDiscoveryProtocol(asyncio.DatagramProtocol):
+    """Queue the sender address of every iTach discovery packet received."""
+
+    def __init__(self):
+        self.hosts: asyncio.Queue[str] = asyncio.Queue()
+
+    def datagram_received(self, data: bytes, addr: tuple[str, int]) -> None:
+        # Match on the raw bytes, other multicast traffic is never decoded
+        if b"iTach" in data:
+            self.hosts.put_nowait(addr[0])
+
+    def error_received(self, exc: Exception) -> None:
+        _LOG.warning("Error receiving iTach discovery packet: %s", exc)
+
+
 async def discover_itach_devices(timeout: int = 30) -> str | None:
     """
     Discover iTach devices over multicast and return the IP of a Lumagen device if available.
@@ -29,7 +44,9 @@ async def discover_itach_devices(timeout: int = 30) -> str | None:
         str | None: IP address of a verified Lumagen device, or None if not found.
     """
     sock = None
-    start = asyncio.get_running_loop().time()
+    transport = None
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
 
     try:
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
@@ -39,28 +56,22 @@ async def discover_itach_devices(timeout: int = 30) -> str | None:
 
         mreq = socket.inet_aton(ITACH_MULTICAST_IP) + socket.inet_aton(MULTICAST_INTERFACE_IP)
         sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, mreq)
-        sock.settimeout(1.0)
+        sock.setblocking(False)
+
+        transport, protocol = await loop.create_datagram_endpoint(_ITachDiscoveryProtocol, sock=sock)
 
         _LOG.debug("Listening for iTach discovery packets on UDP port %d", UDP_DISCOVERY_PORT)
 
-        while asyncio.get_running_loop().time() - start < timeout:
+        while (remaining := deadline - loop.time()) > 0:
             try:
-                data, addr = sock.recvfrom(1024)
-                try:
-                    response = data.decode().strip()
-                except UnicodeDecodeError:
-                    _LOG.warning("Received malformed data, ignoring.")
-                    continue
-
-                if "iTach" in response:
-                    host = addr[0]
-                    _LOG.info("Found iTach at %s", host)
-                    if await validate_lumagen(host):
-                        _LOG.info("Lumagen is alive at %s", host)
-                        return host
-
-            except socket.timeout:
-                await asyncio.sleep(0)
+                host = await asyncio.wait_for(protocol.hosts.get(), remaining)
+            except asyncio.TimeoutError:
+                continue
+
+            _LOG.info("Found iTach at %s", host)
+            if await validate_lumagen(host):
+                _LOG.info("Lumagen is alive at %s", host)
+                return host
 
     except OSError as e:
         _LOG.error("Socket error in iTach listener: %s", e)
@@ -68,7 +79,10 @@ async def discover_itach_devices(timeout: int = 30) -> str | None:
         _LOG.debug("iTach listener task was cancelled")
         raise
     finally:
-        if sock:
+        # The transport owns the socket once the endpoint is created
+        if transport:
+            transport.close()
+        elif sock:
             sock.close()
         _LOG.debug("iTach listener stopped")
 
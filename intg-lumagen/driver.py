@@ -1,17 +1,19 @@
 #!/usr/bin/env python3
 """Lumagen Remote Two/3 Integration Driver."""
 
+import asyncio
 import logging
-from typing import Any
+from typing import Any, Callable
 
 import config
 import ucapi
 from api import api, loop
 from const import EntityPrefix
-from device import Events, LumagenDevice, LumagenInfo
+from device import EVENT_CONNECTED, EVENT_DISCONNECTED, LumagenDevice, LumagenInfo
 from media_player import LumagenMediaPlayer
-from registry import (all_devices, clear_devices, connect_all, disconnect_all,
-                      get_device, register_device, unregister_device)
+from registry import (clear_devices, connect_all, disconnect_all, get_device,
+                      get_device_entity_ids, get_entity_device_id,
+                      register_device, register_entity, unregister_device)
 from remote import REMOTE_STATE_MAPPING, LumagenRemote
 from sensor import LumagenSensor
 from setup_flow import driver_setup_handler
@@ -23,6 +25,31 @@ from utils import setup_logger
 _LOG = logging.getLogger("driver")
 
 
+def _device_info_value(device: LumagenDevice, attr: str) -> Any:
+    """Return a device_info attribute, or an empty string until device info is available."""
+    return getattr(device.device_info, attr) if device.device_info else ""
+
+
+# Initial (value, unit) of each sensor entity, keyed by entity prefix
+_SENSOR_INITIAL_STATE: dict[str, Callable[[LumagenDevice], tuple[Any, str]]] = {
+    EntityPrefix.CURRENT_SOURCE_CONTENT_ASPECT.value:
+        lambda d: (_device_info_value(d, "current_source_content_aspect"), ""),
+    EntityPrefix.DETECTED_SOURCE_ASPECT.value:
+        lambda d: (_device_info_value(d, "detected_source_aspect"), ""),
+    EntityPrefix.INPUT_FORMAT.value: lambda d: ("HDR", ""),
+    EntityPrefix.INPUT_MODE.value: lambda d: ("1920x1080i", ""),
+    EntityPrefix.INPUT_RATE.value: lambda d: ("60", "Hz"),
+    EntityPrefix.OUTPUT_FORMAT.value: lambda d: ("422-REC709", ""),
+    EntityPrefix.OUTPUT_MODE.value: lambda d: ("3840x2160p", ""),
+    EntityPrefix.OUTPUT_RATE.value: lambda d: ("59.94Hz-2D", "Hz"),
+    EntityPrefix.PHYSICAL_INPUT_SELECTED.value:
+        lambda d: (f"Input: {_device_info_value(d, 'physical_input_selected')}", ""),
+}
+
+# Entity prefixes of the sensors exposed for every device
+_SENSOR_PREFIXES = tuple(_SENSOR_INITIAL_STATE)
+
+
 @api.listens_to(ucapi.Events.CONNECT)
 async def on_connect() -> None:
     """Connect all configured receivers when the Remote Two sends the connect command."""
@@ -93,6 +120,9 @@ async def on_subscribe_entities(entity_ids: list[str]) -> None:
             _LOG.error("Failed to subscribe entities: no Lumagen configuration found for %s", device_id)
         return
 
+    # Collect the initial attributes of every entity, then apply them in one pass
+    pending_updates: dict[str, dict[str, Any]] = {}
+
     for entity_id in entity_ids:
         _LOG.debug("entity id = %s", entity_id)
         entity = api.configured_entities.get(entity_id)
@@ -101,121 +131,44 @@ async def on_subscribe_entities(entity_ids: list[str]) -> None:
 
         # Handle Lumagen Sensor entities
         if isinstance(entity, LumagenSensor):
-            _LOG.info("Setting initial state of Lumagen Sensor %s", entity_id)
-
-            if entity_id.startswith(EntityPrefix.CURRENT_SOURCE_CONTENT_ASPECT.value):
-                value = ""
-                if device.device_info:
-                    value = device.device_info.current_source_content_aspect
-                api.configured_entities.update_attributes(
-                    entity_id,
-                    {
-                        SensorAttr.STATE: States.ON,
-                        SensorAttr.VALUE: value,
-                        SensorAttr.UNIT: ""
-                    }
-                )
-            elif entity_id.startswith(EntityPrefix.DETECTED_SOURCE_ASPECT.value):
-                value = ""
-                if device.device_info:
-                    value = device.device_info.detected_source_aspect
-                api.configured_entities.update_attributes(
-                    entity_id,
-                    {
-                        SensorAttr.STATE: States.ON,
-                        SensorAttr.VALUE: value,
-                        SensorAttr.UNIT: ""
-                    }
-                )
-            elif entity_id.startswith(EntityPrefix.INPUT_FORMAT.value):
-                api.configured_entities.update_attributes(
-                    entity_id,
-                    {
-                        SensorAttr.STATE: States.ON,
-                        SensorAttr.VALUE: "HDR",
-                        SensorAttr.UNIT: ""
-                    }
-                )
-            elif entity_id.startswith(EntityPrefix.INPUT_MODE.value):
-                api.configured_entities.update_attributes(
-                    entity_id,
-                    {
-                        SensorAttr.STATE: States.ON,
-                        SensorAttr.VALUE: "1920x1080i",
-                        SensorAttr.UNIT: ""
-                    }
-                )
-            elif entity_id.startswith(EntityPrefix.INPUT_RATE.value):
-                api.configured_entities.update_attributes(
-                    entity_id,
-                    {
-                        SensorAttr.STATE: States.ON,
-                        SensorAttr.VALUE: "60",
-                        SensorAttr.UNIT: "Hz"
-                    }
-                )
-            elif entity_id.startswith(EntityPrefix.OUTPUT_FORMAT.value):
-                api.configured_entities.update_attributes(
-                    entity_id,
-                    {
-                        SensorAttr.STATE: States.ON,
-                        SensorAttr.VALUE: "422-REC709",
-                        SensorAttr.UNIT: ""
-                    }
-                )
-            elif entity_id.startswith(EntityPrefix.OUTPUT_MODE.value):
-                api.configured_entities.update_attributes(
-                    entity_id,
-                    {
-                        SensorAttr.STATE: States.ON,
-                        SensorAttr.VALUE: "3840x2160p",
-                        SensorAttr.UNIT: ""
-                    }
-                )
-            elif entity_id.startswith(EntityPrefix.OUTPUT_RATE.value):
-                api.configured_entities.update_attributes(
-                    entity_id,
-                    {
-                        SensorAttr.STATE: States.ON,
-                        SensorAttr.VALUE: "59.94Hz-2D",
-                        SensorAttr.UNIT: "Hz"
-                    }
-                )
-            elif entity_id.startswith(EntityPrefix.PHYSICAL_INPUT_SELECTED.value):
-                value = ""
-                if device.device_info:
-                    value = device.device_info.physical_input_selected
-                api.configured_entities.update_attributes(
-                    entity_id,
-                    {
-                        SensorAttr.STATE: States.ON,
-                        SensorAttr.VALUE: f"Input: {value}",
-                        SensorAttr.UNIT: ""
-                    }
-                )
-
-            current_value = entity.attributes.get(SensorAttr.VALUE, "unknown")
-            _LOG.info("Updated Lumagen Sensor entity %s with value %s", entity_id, current_value)
+            initial_state = _SENSOR_INITIAL_STATE.get(entity_id.split(".", 1)[0])
+            if initial_state:
+                value, unit = initial_state(device)
+                pending_updates[entity_id] = {
+                    SensorAttr.STATE: States.ON,
+                    SensorAttr.VALUE: value,
+                    SensorAttr.UNIT: unit
+                }
+                _LOG.info("Setting initial state of Lumagen Sensor %s with value %s", entity_id, value)
             continue
 
         # Handle media_player or remote entities
-        _update_entity_attributes(entity_id, entity, device.attributes)
-
+        entity_attributes = _ENTITY_ATTRIBUTES.get(type(entity))
+        if entity_attributes:
+            pending_updates[entity_id] = entity_attributes(device.attributes)
 
-def _update_entity_attributes(entity_id: str, entity, attributes: dict):
-    """
-    Update attributes for the given entity based on its type.
-    """
-    if isinstance(entity, LumagenMediaPlayer):
+    for entity_id, attributes in pending_updates.items():
         api.configured_entities.update_attributes(entity_id, attributes)
-    elif isinstance(entity, LumagenRemote):
-        api.configured_entities.update_attributes(
-            entity_id,
-            {
-                ucapi.remote.Attributes.STATE:
-                REMOTE_STATE_MAPPING.get(attributes.get(MediaAttr.STATE, States.UNKNOWN))
-            }
-        )
+
+
+def _media_player_attributes(attributes: dict) -> dict:
+    """Return the attributes to set on a media player entity."""
+    return attributes
+
+
+def _remote_attributes(attributes: dict) -> dict:
+    """Return the attributes to set on a remote entity."""
+    return {
+        ucapi.remote.Attributes.STATE:
+        REMOTE_STATE_MAPPING.get(attributes.get(MediaAttr.STATE), ucapi.remote.States.UNKNOWN)
+    }
+
+
+# Builds the subscribe-time attributes of an entity, keyed by entity class
+_ENTITY_ATTRIBUTES: dict[type, Callable[[dict], dict]] = {
+    LumagenMediaPlayer: _media_player_attributes,
+    LumagenRemote: _remote_attributes,
+}
 
 
 @api.listens_to(ucapi.Events.UNSUBSCRIBE_ENTITIES)
@@ -223,29 +176,31 @@ async def on_unsubscribe_entities(entity_ids: list[str]) -> None:
     """On unsubscribe, disconnect devices only if no other entities are using them."""
     _LOG.debug("Unsubscribe entities event: %s", entity_ids)
 
+    unsubscribed = set(entity_ids)
+
     # Collect devices associated with the entities being unsubscribed
     devices_to_remove = {
-        config.extract_device_id(api.configured_entities.get(entity_id))
-        for entity_id in entity_ids
-        if api.configured_entities.get(entity_id)
+        device_id
+        for entity_id in unsubscribed
+        if (device_id := get_entity_device_id(entity_id))
     }
 
-    # Check other remaining entities to see if they still use these devices
-    remaining_entities = [
-        e for e in api.configured_entities.get_all()
-        if e.get("entity_id") not in entity_ids
-    ]
-
-    for entity in remaining_entities:
-        device_id = config.extract_device_id(entity)
-        devices_to_remove.discard(device_id)  # discard safely removes if present
+    # Keep devices that still provide other configured entities
+    devices_to_remove = {
+        device_id
+        for device_id in devices_to_remove
+        if not any(
+            api.configured_entities.contains(entity_id)
+            for entity_id in get_device_entity_ids(device_id) - unsubscribed
+        )
+    }
 
-    # Disconnect and clean up devices no longer in use
-    for device_id in devices_to_remove:
-        if device_id in all_devices():
-            device = get_device(device_id)
-            await device.disconnect()
-            device.events.remove_all_listeners()
+    # Disconnect devices no longer in use. They stay registered, so their listeners are kept
+    devices = [device for device_id in devices_to_remove if (device := get_device(device_id))]
+    results = await asyncio.gather(*(device.disconnect() for device in devices), return_exceptions=True)
+    for device, result in zip(devices, results):
+        if isinstance(result, Exception):
+            _LOG.error("Failed to disconnect Lumagen %s: %s", device.device_id, result)
 
 
 
@@ -265,11 +220,11 @@ def _configure_new_lumagen(info: LumagenInfo, connect: bool = False) -> None:
     if device:
         device.disconnect()
     else:
-        device = LumagenDevice(info.address, info.port, device_id=info.id)
+        device = LumagenDevice(info.address, info.port, device_id=info.id, loop=loop)
 
-        device.events.on(Events.CONNECTED.name, on_lumagen_connected)
-        device.events.on(Events.DISCONNECTED.name, on_lumagen_disconnected)
-        device.events.on(Events.UPDATE.name, on_lumagen_update)
+        device.events.on(EVENT_CONNECTED, on_lumagen_connected)
+        device.events.on(EVENT_DISCONNECTED, on_lumagen_disconnected)
+        device.on_update(on_lumagen_update)
 
         register_device(info.id, device)
         _LOG.debug("Registered device: %s", device)
@@ -287,35 +242,25 @@ def _register_available_entities(info: LumagenInfo, device: LumagenDevice) -> No
     :param info: Lumagen configuration
     :param device: Active LumagenDevice for the device
     """
-    for entity_cls in (LumagenRemote, LumagenMediaPlayer):
-        entity = entity_cls(info, device)
-        if api.available_entities.contains(entity.id):
-            api.available_entities.remove(entity.id)
-        api.available_entities.add(entity)
-
-    for sensor in [
-        EntityPrefix.CURRENT_SOURCE_CONTENT_ASPECT,
-        EntityPrefix.DETECTED_SOURCE_ASPECT,
-        EntityPrefix.INPUT_FORMAT,
-        EntityPrefix.INPUT_MODE,
-        EntityPrefix.INPUT_RATE,
-        EntityPrefix.OUTPUT_FORMAT,
-        EntityPrefix.OUTPUT_MODE,
-        EntityPrefix.OUTPUT_RATE,
-        EntityPrefix.PHYSICAL_INPUT_SELECTED,
-    ]:
-        entity = LumagenSensor(info, sensor.value)
-
-        if api.available_entities.contains(entity.id):
+    entities = [
+        LumagenRemote(info, device),
+        LumagenMediaPlayer(info, device),
+        *(LumagenSensor(info, prefix) for prefix in _SENSOR_PREFIXES),
+    ]
+
+    for entity in entities:
+        # Replace any entity previously registered under the same ID
+        if not api.available_entities.add(entity):
             api.available_entities.remove(entity.id)
+            api.available_entities.add(entity)
+        register_entity(entity.id, info.id)
 
-        api.available_entities.add(entity)
 
 async def on_lumagen_connected(device_id: str):
     """Handle Lumagen connection."""
     _LOG.debug("Lumagen connected: %s", device_id)
 
-    if not get_device(device_id):
+    if get_device(device_id) is None:
         _LOG.warning("Lumagen %s is not configured", device_id)
         return
 
@@ -326,32 +271,30 @@ async def on_lumagen_disconnected(device_id: str):
     """Handle Lumagen disconnection."""
     _LOG.debug("Lumagen disconnected: %s", device_id)
 
-    if not get_device(device_id):
+    device = get_device(device_id)
+    if device is None:
         _LOG.warning("Lumagen %s is not configured", device_id)
         return
 
-    device = get_device(device_id)
-    _LOG.debug(device)
+    _LOG.debug("Disconnected device: %s", device)
 
     await api.set_device_state(ucapi.DeviceStates.DISCONNECTED)
 
 
-async def on_lumagen_update(entity_id: str, update: dict[str, Any] | None) -> None:
+def on_lumagen_update(device: LumagenDevice, entity_id: str, update: dict[str, Any] | None) -> None:
     """
     Update attributes of configured media-player or remote entity if device attributes changed.
 
-    :param device_id: Device identifier.
+    :param device: Device that produced the update.
+    :param entity_id: Identifier of the entity to update.
     :param update: Dictionary containing the updated attributes or None.
     """
-    if update is None:
-        return
-
-    device_id = entity_id.split(".", 1)[1]
-    device = get_device(device_id)
-    if device is None:
+    if update is None or get_device(device.device_id) is None:
         return
 
-    _LOG.debug("[%s] Update............: %s", entity_id, update)
+    debug = _LOG.isEnabledFor(logging.DEBUG)
+    if debug:
+        _LOG.debug("[%s] Update............: %s", entity_id, update)
 
     entity: LumagenMediaPlayer | LumagenRemote | None = api.configured_entities.get(entity_id)
     if entity is None:
@@ -360,10 +303,11 @@ async def on_lumagen_update(entity_id: str, update: dict[str, Any] | None) -> No
 
     changed_attrs = entity.filter_changed_attributes(update)
     if changed_attrs:
-        _LOG.debug("Changed Attrs: %s, %s", entity_id, changed_attrs)
         api_update_attributes = api.configured_entities.update_attributes(entity_id, changed_attrs)
-        _LOG.debug("api_update_attributes = %s", api_update_attributes)
-    else:
+        if debug:
+            _LOG.debug("Changed Attrs: %s, %s", entity_id, changed_attrs)
+            _LOG.debug("api_update_attributes = %s", api_update_attributes)
+    elif debug:
         _LOG.debug("attributes not changed")
 
 
@@ -399,6 +343,7 @@ async def _async_remove(device: LumagenDevice) -> None:
     _LOG.debug("Disconnecting and removing all listeners")
     await device.disconnect()
     device.events.remove_all_listeners()
+    device.remove_update_listeners()
 
 
 async def main():
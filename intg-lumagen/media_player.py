@@ -6,15 +6,21 @@ Media-player entity functions.
 """
 
 import logging
-from typing import Any
+from typing import Any, Awaitable, Callable, ClassVar
 
 from const import MediaPlayerDef, SimpleCommands
 from device import LumagenDevice, LumagenInfo
 from ucapi import MediaPlayer, StatusCodes
-from ucapi.media_player import Attributes, Commands, DeviceClasses, States
+from ucapi.media_player import Attributes, Commands, DeviceClasses
 
 _LOG = logging.getLogger(__name__)
 
+# Simple commands of the media player, shared by all instances
+_SIMPLE_COMMANDS = tuple(SimpleCommands)
+
+# Attributes forwarded from device updates to the media player entity
+_FILTERED_ATTRIBUTES = (Attributes.STATE, Attributes.SOURCE, Attributes.SOURCE_LIST)
+
 class LumagenMediaPlayer(MediaPlayer):
     """Representation of a Lumagen Media Player entity."""
 
@@ -24,7 +30,7 @@ class LumagenMediaPlayer(MediaPlayer):
         entity_id = f"media_player.{mp_info.id}"
         features = MediaPlayerDef.features
         attributes = MediaPlayerDef.attributes
-        self.simple_commands = [*SimpleCommands]
+        self.simple_commands = _SIMPLE_COMMANDS
 
         options = {
             #Options.SIMPLE_COMMANDS: self.simple_commands
@@ -50,20 +56,22 @@ class LumagenMediaPlayer(MediaPlayer):
         :param params: optional command parameters
         :return: status code of the command request
         """
-        _LOG.info("Got %s command request: %s %s", self.id, cmd_id, params)
+        if _LOG.isEnabledFor(logging.INFO):
+            _LOG.info("Got %s command request: %s %s", self.id, cmd_id, params)
 
-        try:
-            cmd = Commands(cmd_id)
-        except ValueError:
+        handler = self._COMMAND_HANDLERS.get(cmd_id)
+        if handler is None:
             return StatusCodes.NOT_IMPLEMENTED
+        return await handler(self, params or {})
 
-        match cmd:
-            case Commands.SELECT_SOURCE:
-                res = await self._device.select_source(params.get("source"))
-            case _:
-                return StatusCodes.NOT_IMPLEMENTED
+    async def _select_source(self, params: dict[str, Any]) -> StatusCodes:
+        """Handle the SELECT_SOURCE command."""
+        return await self._device.select_source(params.get("source"))
 
-        return res
+    # Media player entity commands and the methods handling them
+    _COMMAND_HANDLERS: ClassVar[dict[str, Callable[..., Awaitable[StatusCodes]]]] = {
+        Commands.SELECT_SOURCE: _select_source,
+    }
 
     def filter_changed_attributes(self, update: dict[str, Any]) -> dict[str, Any]:
         """
@@ -73,14 +81,13 @@ class LumagenMediaPlayer(MediaPlayer):
         :return: filtered entity attributes containing changed attributes only.
         """
         attributes = {}
+        current = self.attributes
 
-        for key in (Attributes.STATE, Attributes.SOURCE, Attributes.SOURCE_LIST):
-            if key in update and key in self.attributes:
-                if update[key] != self.attributes[key]:
+        for key in _FILTERED_ATTRIBUTES:
+            if key in update and key in current:
+                if update[key] != current[key]:
                     attributes[key] = update[key]
 
-        if attributes.get(Attributes.STATE) == States:
-            attributes[Attributes.SOURCE] = ""
-
-        _LOG.debug("LumagenMediaPlayer update attributes %s -> %s", update, attributes)
+        if _LOG.isEnabledFor(logging.DEBUG):
+            _LOG.debug("LumagenMediaPlayer update attributes %s -> %s", update, attributes)
         return attributes
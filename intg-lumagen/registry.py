@@ -4,11 +4,18 @@ Registry for active LumagenDevice instances.
 Used to store and retrieve device connections by device ID.
 """
 
-from typing import Dict, Iterator
+import asyncio
+import logging
+from collections.abc import Iterator, Mapping
+from types import MappingProxyType
 
 from device import LumagenDevice
 
-_configured_lumagens: Dict[str, LumagenDevice] = {}
+_LOG = logging.getLogger(__name__)
+
+_configured_lumagens: dict[str, LumagenDevice] = {}
+_entity_devices: dict[str, str] = {}
+_device_entities: dict[str, set[str]] = {}
 
 
 def get_device(device_id: str) -> LumagenDevice | None:
@@ -45,16 +52,56 @@ def unregister_device(device_id: str) -> None:
         device_id: Unique identifier of the device to remove.
     """
     _configured_lumagens.pop(device_id, None)
+    for entity_id in _device_entities.pop(device_id, ()):
+        _entity_devices.pop(entity_id, None)
+
+
+def register_entity(entity_id: str, device_id: str) -> None:
+    """
+    Associate an entity ID with the device that provides it.
+
+    Args:
+        entity_id: Identifier of the media player, remote or sensor entity.
+        device_id: Unique identifier for the Lumagen device.
+    """
+    _entity_devices[entity_id] = device_id
+    _device_entities.setdefault(device_id, set()).add(entity_id)
 
 
-def all_devices() -> Dict[str, LumagenDevice]:
+def get_entity_device_id(entity_id: str) -> str | None:
     """
-    Get a dictionary of all currently registered devices.
+    Retrieve the device ID registered for a given entity ID.
+
+    Args:
+        entity_id: Identifier of the entity.
 
     Returns:
-        A dictionary mapping device IDs to their LumagenDevice instances.
+        The device ID, or None if the entity is not registered.
     """
-    return _configured_lumagens
+    return _entity_devices.get(entity_id)
+
+
+def get_device_entity_ids(device_id: str) -> set[str]:
+    """
+    Retrieve the entity IDs registered for a given device ID.
+
+    Args:
+        device_id: Unique identifier for the Lumagen device.
+
+    Returns:
+        The set of entity IDs, empty if the device has no registered entities.
+    """
+    return _device_entities.get(device_id, set())
+
+
+def all_devices() -> Mapping[str, LumagenDevice]:
+    """
+    Get a read-only view of all currently registered devices.
+
+    Returns:
+        A mapping of device IDs to their LumagenDevice instances.
+    """
+    return MappingProxyType(_configured_lumagens)
 
 
 def clear_devices() -> None:
@@ -62,22 +109,30 @@ def clear_devices() -> None:
     Remove all registered devicess from the registry.
     """
     _configured_lumagens.clear()
+    _entity_devices.clear()
+    _device_entities.clear()
 
 
 async def connect_all() -> None:
     """
     Connect all registered LumagenDevice instances asynchronously.
     """
-    for device in iter_devices():
-        await device.connect()
+    devices = _devices()
+    results = await asyncio.gather(*(device.connect() for device in devices), return_exceptions=True)
+    for device, result in zip(devices, results):
+        if isinstance(result, Exception):
+            _LOG.warning("Failed to connect %s: %s", device, result)
 
 
 async def disconnect_all() -> None:
     """
     Disconnect all registered LumagenDevice instances asynchronously.
     """
-    for device in iter_devices():
-        await device.disconnect()
+    devices = _devices()
+    results = await asyncio.gather(*(device.disconnect() for device in devices), return_exceptions=True)
+    for device, result in zip(devices, results):
+        if isinstance(result, Exception):
+            _LOG.warning("Failed to disconnect %s: %s", device, result)
 
 
 def iter_devices() -> Iterator[LumagenDevice]:
@@ -87,4 +142,9 @@ def iter_devices() -> Iterator[LumagenDevice]:
     Returns:
         An iterator over all registered device objects.
     """
-    return iter(_configured_lumagens.values())
+    return iter(_devices())
+
+
+def _devices() -> tuple[LumagenDevice, ...]:
+    """Return a snapshot of the registered devices, safe to iterate while the registry changes."""
+    return tuple(_configured_lumagens.values())
@@ -8,18 +8,29 @@ Sensor entity functions.
 import logging
 from typing import Any
 
+from const import EntityPrefix
 from device import LumagenInfo
 from ucapi.sensor import Attributes, DeviceClasses, Options, Sensor, States
 
 _LOG = logging.getLogger(__name__)
 
+# Title-cased sensor name suffixes by entity prefix (e.g. "input_rate" -> "Input Rate")
+_SENSOR_LABELS = {prefix.value: prefix.value.replace("_", " ").title() for prefix in EntityPrefix}
+
+# Sensor entity options, shared by all instances
+_SENSOR_OPTIONS = {Options.DECIMALS: 1}
+
+# Attributes forwarded from device updates to the sensor entity
+_FILTERED_ATTRIBUTES = (Attributes.STATE, Attributes.VALUE)
+
 class LumagenSensor(Sensor):
     """Representation of a Lumagen Sensor entity."""
 
     def __init__(self, info: LumagenInfo, sensor: str):
         """Initialize a Lumagen Sensor entity."""
         entity_id = f"{sensor}.{info.id}"
-        name = info.name + " " + sensor.replace("_", " ")#f"{info.name} #{sensor.replace("_", " ")}".title()
+        label = _SENSOR_LABELS.get(sensor) or sensor.replace("_", " ").title()
+        name = f"{info.name.title()} {label}"
 
         attributes = {
             Attributes.STATE: States.UNKNOWN,
@@ -27,15 +38,13 @@ class LumagenSensor(Sensor):
             Attributes.UNIT: "unknown",
         }
 
-        options = { Options.DECIMALS: 1}
-
         super().__init__(
             identifier=entity_id,
-            name=name.title(),
+            name=name,
             features=[],
             attributes=attributes,
             device_class=DeviceClasses.CUSTOM,
-            options=options
+            options=_SENSOR_OPTIONS
         )
 
         _LOG.debug("Lumagen Sensor init %s : %s", entity_id, attributes)
@@ -49,17 +58,17 @@ class LumagenSensor(Sensor):
         """
 
         attributes = {}
+        current = self.attributes
 
-        for key in (Attributes.STATE, Attributes.VALUE):
-            if key in update and key in self.attributes:
-                if update[key] != self.attributes[key]:
+        for key in _FILTERED_ATTRIBUTES:
+            if key in update and key in current:
+                if update[key] != current[key]:
                     attributes[key] = update[key]
 
-        if Attributes.STATE in attributes:
-            if attributes[Attributes.STATE] == States.UNKNOWN:
-                attributes[Attributes.VALUE] = "none"
+        if attributes.get(Attributes.STATE) == States.UNKNOWN:
+            attributes[Attributes.VALUE] = "none"
 
-        if attributes:
+        if attributes and _LOG.isEnabledFor(logging.DEBUG):
             _LOG.debug("Lumagen Sensor update attributes %s -> %s", update, attributes)
 
         return attributes